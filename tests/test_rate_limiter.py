@@ -0,0 +1,64 @@
+import pytest
+
+import app
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(app.time, 'monotonic', clock.monotonic)
+    monkeypatch.setattr(app.time, 'sleep', clock.sleep)
+    return clock
+
+
+def test_allows_rate_limit_calls_without_waiting(clock):
+    limiter = app.RateLimiter(3, 60)
+    for _ in range(3):
+        with limiter:
+            pass
+    assert clock.sleeps == []
+
+
+def test_waits_until_the_oldest_call_leaves_the_window(clock):
+    limiter = app.RateLimiter(2, 60)
+    with limiter:
+        pass
+    clock.now = 10
+    with limiter:
+        pass
+    clock.now = 20
+    with limiter:
+        pass
+    # The call at t=0 expires at t=60
+    assert clock.sleeps == [40]
+    assert clock.now == 60
+
+
+def test_window_slides_instead_of_resetting(clock):
+    limiter = app.RateLimiter(2, 60)
+    with limiter:
+        pass
+    clock.now = 50
+    with limiter:
+        pass
+    clock.now = 61
+    # Only the t=0 call has expired, so one slot is free and the next one opens at t=110
+    with limiter:
+        pass
+    assert clock.sleeps == []
+    with limiter:
+        pass
+    assert clock.sleeps == [49]
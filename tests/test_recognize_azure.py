@@ -0,0 +1,54 @@
+import pytest
+import speech_recognition as sr
+
+import app
+
+
+class FakeResponse:
+    def __init__(self, result=None, ok=True, reason='OK'):
+        self.result = result
+        self.ok = ok
+        self.reason = reason
+
+    def json(self):
+        return self.result
+
+
+class FakeSession:
+    def __init__(self, response):
+        self.response = response
+        self.calls = []
+
+    def post(self, url, **kwargs):
+        self.calls.append((url, kwargs))
+        return self.response
+
+
+def recognize(response):
+    session = FakeSession(response)
+    r = app.PooledRecognizer(session)
+    audio = sr.AudioData(b'\x01\x00' * 1600, app.SAMPLE_RATE, 2)
+    return r.recognize_azure(audio, key='secret', language='de-DE', location='westeurope'), session
+
+
+def test_posts_pcm_wav_with_the_key_header():
+    text, session = recognize(FakeResponse({'RecognitionStatus': 'Success', 'DisplayText': 'Hallo Welt.'}))
+    assert text == 'Hallo Welt.'
+    url, kwargs = session.calls[0]
+    assert url.startswith('https://westeurope.stt.speech.microsoft.com/')
+    assert kwargs['headers']['Ocp-Apim-Subscription-Key'] == 'secret'
+    assert kwargs['headers']['Content-Type'] == f'audio/wav; codecs=audio/pcm; samplerate={app.SAMPLE_RATE}'
+    assert kwargs['params']['language'] == 'de-DE'
+    # A 44-byte WAV header in front of the untouched samples
+    assert kwargs['data'][:4] == b'RIFF'
+    assert kwargs['data'][44:] == b'\x01\x00' * 1600
+
+
+def test_no_match_is_unknown_value():
+    with pytest.raises(sr.UnknownValueError):
+        recognize(FakeResponse({'RecognitionStatus': 'NoMatch'}))
+
+
+def test_http_error_is_request_error():
+    with pytest.raises(sr.RequestError, match='Unauthorized'):
+        recognize(FakeResponse(ok=False, reason='Unauthorized'))
@@ -0,0 +1,64 @@
+import inspect
+
+import pytest
+import speech_recognition as sr
+
+import app
+
+CLOUD_APIS = ['google', 'wit', 'azure', 'houndify']
+
+
+@pytest.fixture
+def recognizer(monkeypatch):
+    monkeypatch.setattr(app.time, 'sleep', lambda seconds: None)
+    return app.PooledRecognizer(session=None)
+
+
+def stub_api(monkeypatch, r, api, responses):
+    """
+    Replace r.recognize_<api> with a stub that validates its arguments against the real method's signature,
+    then returns or raises the given responses in order.
+    """
+    name = f'recognize_{api}'
+    signature = inspect.signature(getattr(type(r), name))
+    calls = []
+
+    def stub(*args, **kwargs):
+        signature.bind(r, *args, **kwargs)
+        calls.append(kwargs)
+        response = responses[len(calls) - 1]
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    monkeypatch.setattr(r, name, stub)
+    return calls
+
+
+def audio():
+    return sr.AudioData(b'\x00\x00' * 1600, app.SAMPLE_RATE, 2)
+
+
+@pytest.mark.parametrize('api', CLOUD_APIS)
+def test_calls_the_real_method_signature_through_the_limiter(monkeypatch, recognizer, api):
+    calls = stub_api(monkeypatch, recognizer, api, ['hello'])
+    assert app.recognize(recognizer, audio(), api, 'en-US') == 'hello'
+    assert len(calls) == 1
+    assert len(recognizer.rate_limiter.calls) == 1
+
+
+@pytest.mark.parametrize('api', CLOUD_APIS)
+def test_retries_after_429(monkeypatch, recognizer, api):
+    too_many = sr.RequestError('recognition request failed: Too Many Requests')
+    calls = stub_api(monkeypatch, recognizer, api, [too_many, too_many, 'hello'])
+    assert app.recognize(recognizer, audio(), api, 'en-US') == 'hello'
+    assert len(calls) == 3
+    assert len(recognizer.rate_limiter.calls) == 3
+
+
+@pytest.mark.parametrize('api', CLOUD_APIS)
+def test_other_request_errors_are_not_retried(monkeypatch, recognizer, api):
+    calls = stub_api(monkeypatch, recognizer, api, [sr.RequestError('recognition request failed: Forbidden')])
+    with pytest.raises(sr.RequestError, match='Forbidden'):
+        app.recognize(recognizer, audio(), api, 'en-US')
+    assert len(calls) == 1
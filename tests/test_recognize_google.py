@@ -0,0 +1,59 @@
+import json
+
+import pytest
+import speech_recognition as sr
+
+import app
+
+
+class FakeResponse:
+    def __init__(self, text='', ok=True, reason='OK'):
+        self.text = text
+        self.ok = ok
+        self.reason = reason
+
+
+class FakeSession:
+    def __init__(self, response):
+        self.response = response
+        self.calls = []
+
+    def post(self, url, **kwargs):
+        self.calls.append((url, kwargs))
+        return self.response
+
+
+def recognize(response_text, **kwargs):
+    session = FakeSession(FakeResponse(response_text, **kwargs))
+    r = app.PooledRecognizer(session)
+    audio = sr.AudioData(b'\x01\x00' * 1600, app.SAMPLE_RATE, 2)
+    return r.recognize_google(audio, language='fr-FR'), session
+
+
+def result_line(*transcripts):
+    return json.dumps({'result': [{'alternative': [{'transcript': t} for t in transcripts]}], 'result_index': 0})
+
+
+def test_sends_raw_l16_pcm():
+    _, session = recognize(result_line('bonjour'))
+    url, kwargs = session.calls[0]
+    assert url == app.GOOGLE_SPEECH_URL
+    assert kwargs['headers'] == {'Content-Type': f'audio/l16; rate={app.SAMPLE_RATE}'}
+    assert kwargs['data'] == b'\x01\x00' * 1600
+    assert kwargs['params']['lang'] == 'fr-FR'
+
+
+def test_skips_the_empty_first_result_line():
+    text, _ = recognize('{"result":[]}\n' + result_line('bonjour le monde', 'bonjour') + '\n')
+    assert text == 'bonjour le monde'
+
+
+@pytest.mark.parametrize('response_text', ['', '{"result":[]}\n', '{"result":[{"alternative":[{}]}]}'])
+def test_no_transcript_is_unknown_value(response_text):
+    with pytest.raises(sr.UnknownValueError):
+        recognize(response_text)
+
+
+def test_http_error_is_request_error():
+    with pytest.raises(sr.RequestError, match='Too Many Requests'):
+        recognize('', ok=False, reason='Too Many Requests')
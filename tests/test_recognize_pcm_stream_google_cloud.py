@@ -0,0 +1,106 @@
+import subprocess
+import threading
+from types import SimpleNamespace
+
+import pytest
+import speech_recognition as sr
+
+import app
+
+
+class FakeAPICallError(Exception):
+    pass
+
+
+class FakeRequest:
+    def __init__(self, audio_content):
+        self.audio_content = audio_content
+
+
+class FakeRecognitionConfig:
+    class AudioEncoding:
+        LINEAR16 = 'LINEAR16'
+
+    def __init__(self, **kwargs):
+        pass
+
+
+class FakeClient:
+    """
+    Consumes the request iterator on a separate thread like gRPC does, failing the call if the iterator raises
+    and returning one final result per stream with the number of bytes received.
+    """
+    def __init__(self):
+        self.streams = []
+
+    def streaming_recognize(self, config, requests):
+        received = []
+        errors = []
+
+        def consume():
+            try:
+                for request in requests:
+                    received.append(request.audio_content)
+            except Exception as e:
+                errors.append(e)
+
+        thread = threading.Thread(target=consume)
+        thread.start()
+        thread.join()
+        self.streams.append(received)
+        if errors:
+            raise FakeAPICallError(f"Exception iterating requests: {errors[0]}")
+        alternative = SimpleNamespace(transcript=str(sum(map(len, received))))
+        yield SimpleNamespace(results=[SimpleNamespace(is_final=True, alternatives=[alternative])])
+
+
+@pytest.fixture
+def recognizer(monkeypatch):
+    fake_speech = SimpleNamespace(
+        StreamingRecognitionConfig=lambda **kwargs: kwargs,
+        RecognitionConfig=FakeRecognitionConfig,
+        StreamingRecognizeRequest=FakeRequest,
+    )
+    monkeypatch.setattr(app, 'speech', fake_speech)
+    monkeypatch.setattr(app, 'GoogleAPICallError', FakeAPICallError, raising=False)
+    r = app.PooledRecognizer(session=None)
+    r._speech_client = FakeClient()
+    return r
+
+
+def pcm(chunks, error=None):
+    for chunk in chunks:
+        yield chunk
+    if error is not None:
+        raise error
+
+
+def test_streams_every_chunk(recognizer):
+    assert list(app.recognize_pcm_stream_google_cloud(recognizer, pcm([b'ab', b'cd', b'ef']))) == ['6']
+    assert recognizer.speech_client.streams == [[b'ab', b'cd', b'ef']]
+
+
+def test_restarts_the_stream_at_the_limit(monkeypatch, recognizer):
+    monkeypatch.setattr(app, 'STREAM_LIMIT_SECONDS', 4 / (app.SAMPLE_RATE * 2))
+    chunks = [b'ab', b'cd', b'ef']
+    assert list(app.recognize_pcm_stream_google_cloud(recognizer, pcm(chunks))) == ['4', '2']
+    assert recognizer.speech_client.streams == [[b'ab', b'cd'], [b'ef']]
+
+
+def test_decoder_errors_reach_the_caller(recognizer):
+    error = subprocess.CalledProcessError(1, ['ffmpeg'])
+    parts = app.recognize_pcm_stream_google_cloud(recognizer, pcm([b'ab', b'cd'], error))
+    # The audio sent before the failure is still transcribed, then the decoder's own error is raised
+    assert next(parts) == '4'
+    with pytest.raises(subprocess.CalledProcessError):
+        next(parts)
+
+
+def test_api_errors_become_request_errors(recognizer):
+    def failing(config, requests):
+        raise FakeAPICallError('Unauthenticated')
+        yield
+
+    recognizer._speech_client.streaming_recognize = failing
+    with pytest.raises(sr.RequestError, match='Unauthenticated'):
+        list(app.recognize_pcm_stream_google_cloud(recognizer, pcm([b'ab'])))
@@ -0,0 +1,46 @@
+import numpy as np
+import speech_recognition as sr
+
+import app
+
+RATE = app.SAMPLE_RATE
+FRAME = RATE // 10
+
+
+def make_audio(seconds, silent_frames=(), extra_samples=0):
+    # Loud noise everywhere except the given 100 ms frames
+    rng = np.random.default_rng(0)
+    n_samples = int(seconds * RATE) + extra_samples
+    pcm = rng.integers(8000, 16000, n_samples).astype(np.int16)
+    for index in silent_frames:
+        pcm[index * FRAME:(index + 1) * FRAME] = 0
+    return sr.AudioData(pcm.tobytes(), RATE, 2), pcm
+
+
+def chunk_lengths(chunks):
+    return [len(chunk.get_raw_data()) // 2 for chunk in chunks]
+
+
+def test_short_audio_is_a_single_chunk():
+    audio, _ = make_audio(app.SINGLE_REQUEST_SECONDS)
+    assert app.split_on_silence(audio) == [audio]
+
+
+def test_cuts_at_silence_near_the_boundary():
+    audio, pcm = make_audio(70, silent_frames=[280, 570])
+    chunks = app.split_on_silence(audio)
+    assert chunk_lengths(chunks) == [280 * FRAME, 290 * FRAME, len(pcm) - 570 * FRAME]
+
+
+def test_chunks_cover_all_samples_in_order():
+    audio, pcm = make_audio(200, extra_samples=FRAME // 2)
+    chunks = app.split_on_silence(audio)
+    assert b''.join(chunk.get_raw_data() for chunk in chunks) == pcm.tobytes()
+    assert all(length <= (app.CHUNK_SECONDS + 5) * RATE for length in chunk_lengths(chunks))
+
+
+def test_tail_chunk_is_never_a_sliver():
+    # Silence in the very last frame, plus a partial frame, would tempt a cut leaving < 200 ms
+    audio, _ = make_audio(65, silent_frames=[320, 649], extra_samples=FRAME // 2)
+    chunks = app.split_on_silence(audio)
+    assert chunk_lengths(chunks)[-1] >= 5 * RATE
@@ -0,0 +1,54 @@
+import pytest
+import speech_recognition as sr
+
+import app
+
+
+class FakeMicrophone:
+    def __init__(self, **kwargs):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class FakeRecognizer:
+    def listen(self, source):
+        return sr.AudioData(b'\x00\x00' * 1600, app.SAMPLE_RATE, 2)
+
+
+@pytest.fixture(autouse=True)
+def microphone(monkeypatch):
+    monkeypatch.setattr(app.sr, 'Microphone', FakeMicrophone)
+    monkeypatch.setattr(app, 'get_recognizer', FakeRecognizer)
+    monkeypatch.setattr(app.st, 'info', lambda *args, **kwargs: None)
+
+
+def test_returns_the_transcription(monkeypatch):
+    monkeypatch.setattr(app, 'recognize', lambda r, audio, api, language: 'hello there')
+    assert app.transcribe_speech('google', 'en-US') == 'hello there'
+
+
+@pytest.mark.parametrize('error, message', [
+    (sr.UnknownValueError(), 'did not understand'),
+    (sr.RequestError('Forbidden'), 'Could not request results from google service; Forbidden'),
+])
+def test_recognition_errors_raise_instead_of_returning_text(monkeypatch, error, message):
+    def recognize(r, audio, api, language):
+        raise error
+
+    monkeypatch.setattr(app, 'recognize', recognize)
+    with pytest.raises(app.TranscriptionError, match=message):
+        app.transcribe_speech('google', 'en-US')
+
+
+def test_keyed_api_errors_name_the_credential(monkeypatch):
+    def recognize(r, audio, api, language):
+        raise sr.RequestError('Unauthorized')
+
+    monkeypatch.setattr(app, 'recognize', recognize)
+    with pytest.raises(app.TranscriptionError, match='Please check your API key'):
+        app.transcribe_speech('azure', 'en-US')
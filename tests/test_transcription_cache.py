@@ -0,0 +1,104 @@
+import io
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import pytest
+import speech_recognition as sr
+
+import app
+
+DAY = 86400
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(monkeypatch, tmp_path):
+    monkeypatch.setattr(app, 'CACHE_DIR', str(tmp_path))
+    cache = (OrderedDict(), threading.Lock())
+    monkeypatch.setattr(app, 'get_transcription_cache', lambda: cache)
+    return tmp_path
+
+
+def write_entry(cache_dir, key, text, age_days=0):
+    path = cache_dir / f"{key}.json"
+    path.write_text(json.dumps({'text': text}), encoding='utf-8')
+    mtime = time.time() - age_days * DAY
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+def test_round_trips_through_disk(cache_dir):
+    app.store_cached_transcription('key', 'hello')
+    app.get_transcription_cache()[0].clear()
+    assert app.load_cached_transcription('key') == 'hello'
+    assert app.load_cached_transcription('missing') is None
+
+
+def test_expired_entries_are_ignored(cache_dir):
+    write_entry(cache_dir, 'old', 'stale', age_days=app.CACHE_MAX_AGE_DAYS + 1)
+    assert app.load_cached_transcription('old') is None
+    assert 'old' not in app.get_transcription_cache()[0]
+
+
+def test_disk_hits_refresh_mtime(cache_dir):
+    path = write_entry(cache_dir, 'key', 'hello', age_days=app.CACHE_MAX_AGE_DAYS - 1)
+    assert app.load_cached_transcription('key') == 'hello'
+    assert time.time() - os.path.getmtime(path) < DAY
+    # The hit is kept in memory for the next lookup
+    assert app.get_transcription_cache()[0]['key'] == 'hello'
+
+
+def test_pruning_keeps_the_most_recent_entries(monkeypatch, cache_dir):
+    monkeypatch.setattr(app, 'CACHE_MAX_ENTRIES', 3)
+    for i in range(5):
+        write_entry(cache_dir, f"key{i}", str(i), age_days=5 - i)
+    write_entry(cache_dir, 'expired', 'stale', age_days=app.CACHE_MAX_AGE_DAYS + 1)
+    app.prune_disk_cache()
+    assert sorted(p.name for p in cache_dir.iterdir()) == ['key2.json', 'key3.json', 'key4.json']
+
+
+def test_memory_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(app, 'CACHE_MAX_ENTRIES', 2)
+    for key in ['a', 'b', 'c']:
+        app.store_cached_transcription(key, key, persist=False)
+    assert list(app.get_transcription_cache()[0]) == ['b', 'c']
+
+
+@pytest.fixture
+def fake_decoding(monkeypatch):
+    monkeypatch.setattr(app, 'av', None)
+    monkeypatch.setattr(app, 'ffmpeg_available', lambda: True)
+    monkeypatch.setattr(app, 'get_recognizer', lambda: None)
+    monkeypatch.setattr(app, 'decode_mp3_ffmpeg', lambda data: sr.AudioData(b'\x00\x00' * 1600, app.SAMPLE_RATE, 2))
+
+
+def run_transcription(monkeypatch, parts):
+    def recognize_chunks(r, chunks, api, language):
+        for part in parts:
+            if isinstance(part, Exception):
+                raise part
+            yield part
+
+    monkeypatch.setattr(app, 'recognize_chunks', recognize_chunks)
+    return list(app.transcribe_mp3(io.BytesIO(b'mp3 bytes'), 'google', 'en-US'))
+
+
+def test_successful_runs_are_stored(monkeypatch, cache_dir, fake_decoding):
+    assert run_transcription(monkeypatch, ['hello', 'there']) == ['hello', 'there']
+    key = app.transcription_cache_key(b'mp3 bytes', 'google', 'en-US')
+    assert json.loads((cache_dir / f"{key}.json").read_text(encoding='utf-8')) == {'text': 'hello there'}
+
+
+@pytest.mark.parametrize('parts', [
+    [sr.RequestError('Forbidden')],
+    ['hello', sr.RequestError('Forbidden')],
+    [sr.UnknownValueError()],
+    [],
+])
+def test_error_runs_are_never_stored(monkeypatch, cache_dir, fake_decoding, parts):
+    with pytest.raises(app.TranscriptionError):
+        run_transcription(monkeypatch, parts)
+    assert list(cache_dir.iterdir()) == []
+    assert not app.get_transcription_cache()[0]